@@ -7,12 +7,11 @@ This script helps identify common issues and provides solutions.
 import sys
 import os
 import logging
-import traceback
-import subprocess
-import importlib
-import platform
 from pathlib import Path
 
+# Heavy modules (subprocess, importlib, platform, traceback) are imported
+# lazily inside the checks that need them to keep import cost near zero
+
 # Setup basic logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,11 +19,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cached results of external-binary checks, keyed by binary fingerprint
+_CACHE_FILE = Path.home() / '.cache' / 'chimera' / 'diagnostic.json'
+
 class ChimeraDiagnostic:
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.issues_found = []
         self.solutions = []
-        
+        self.use_cache = use_cache
+        self._cache = None
+
+    def _binary_fingerprint(self, binary):
+        """Fingerprint a binary as 'path:mtime_ns:size', or None if missing."""
+        import shutil
+
+        path = shutil.which(binary)
+        if not path:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+    def _cached_check(self, check_name, fingerprint):
+        """Return the cached result for a check, or None on miss/disabled."""
+        if not self.use_cache or fingerprint is None:
+            return None
+        if self._cache is None:
+            import json
+            try:
+                self._cache = json.loads(_CACHE_FILE.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self._cache = {}
+        entry = self._cache.get(check_name)
+        if entry and entry.get('fingerprint') == fingerprint:
+            return entry.get('result')
+        return None
+
+    def _store_check(self, check_name, fingerprint, result):
+        """Persist a successful check so later runs can skip the subprocess.
+
+        Failures are not cached: they are often transient (network, PATH)
+        and would otherwise mask a fix that does not touch the binary.
+        """
+        if not self.use_cache or fingerprint is None or not result:
+            return
+        import json
+
+        if self._cache is None:
+            self._cache = {}
+        self._cache[check_name] = {'fingerprint': fingerprint, 'result': result}
+        try:
+            _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _CACHE_FILE.write_text(json.dumps(self._cache), encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not write diagnostic cache: {e}")
+
     def log_issue(self, issue, solution=""):
         self.issues_found.append(issue)
         if solution:
@@ -51,7 +102,9 @@ class ChimeraDiagnostic:
     def check_required_modules(self):
         """Check if all required Python modules are available."""
         logger.info("Checking required Python modules...")
-        
+
+        import importlib.util
+
         required_modules = [
             ('asyncio', 'Built-in Python module'),
             ('websockets', 'pip install websockets'),
@@ -60,23 +113,27 @@ class ChimeraDiagnostic:
             ('struct', 'Built-in Python module'),
             ('time', 'Built-in Python module'),
         ]
-        
+
         all_ok = True
         for module_name, install_cmd in required_modules:
-            try:
-                importlib.import_module(module_name)
+            # Already-imported modules only need a sys.modules probe; for the
+            # rest, find_spec confirms availability without executing their
+            # top-level code (importing vgamepad would probe the ViGEm driver)
+            if module_name in sys.modules or importlib.util.find_spec(module_name) is not None:
                 logger.info(f"Module '{module_name}' - OK")
-            except ImportError as e:
+            else:
                 self.log_issue(
                     f"Module '{module_name}' not found",
                     f"Install with: {install_cmd}"
                 )
                 all_ok = False
-        
+
         return all_ok
 
     def check_vgamepad_drivers(self):
         """Check if ViGEm drivers are installed (Windows only)."""
+        import platform
+
         if platform.system() != "Windows":
             logger.info("Skipping ViGEm driver check (not Windows)")
             return True
@@ -99,23 +156,30 @@ class ChimeraDiagnostic:
     def check_network_ports(self):
         """Check if required network ports are available."""
         logger.info("Checking network ports...")
-        
+
         import socket
+        from contextlib import ExitStack
+
         ports_to_check = [8080, 9000]  # HTTP and WebSocket ports
-        
+
         all_ok = True
-        for port in ports_to_check:
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                logger.info(f"Port {port} - Available")
-            except OSError as e:
-                self.log_issue(
-                    f"Port {port} is not available: {e}",
-                    f"Stop any service using port {port} or change the port in configuration"
+        # Probe all ports in one pass, holding the sockets open together and
+        # closing them in a single batch when the stack unwinds
+        with ExitStack() as stack:
+            for port in ports_to_check:
+                sock = stack.enter_context(
+                    socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 )
-                all_ok = False
-        
+                try:
+                    sock.bind(('localhost', port))
+                    logger.info(f"Port {port} - Available")
+                except OSError as e:
+                    self.log_issue(
+                        f"Port {port} is not available: {e}",
+                        f"Stop any service using port {port} or change the port in configuration"
+                    )
+                    all_ok = False
+
         return all_ok
 
     def check_file_structure(self):
@@ -125,35 +189,45 @@ class ChimeraDiagnostic:
         required_files = [
             'main.go',
             'gamepad.py',
-            'server.py', 
+            'server.py',
             'index.html',
             'utils.py'
         ]
-        
+
+        # One scandir per directory instead of one stat per (file, dir) pair;
+        # membership tests below are then plain set lookups
+        directory_names = {}
+
+        def _names(subdir):
+            if subdir not in directory_names:
+                try:
+                    with os.scandir(subdir) as entries:
+                        directory_names[subdir] = {entry.name for entry in entries}
+                except OSError:
+                    directory_names[subdir] = set()
+            return directory_names[subdir]
+
         all_ok = True
-        current_dir = Path('.')
-        
+
         for filename in required_files:
-            file_path = current_dir / filename
-            if file_path.exists():
+            if filename in _names('.'):
                 logger.info(f"File '{filename}' - OK")
             else:
                 # Also check in common subdirectories
                 found = False
-                for subdir in ['gamepad-ws-server/src', 'web', '.']:
-                    alt_path = current_dir / subdir / filename
-                    if alt_path.exists():
+                for subdir in ['gamepad-ws-server/src', 'web']:
+                    if filename in _names(subdir):
                         logger.info(f"File '{filename}' found in '{subdir}' - OK")
                         found = True
                         break
-                
+
                 if not found:
                     self.log_issue(
                         f"Required file '{filename}' not found",
                         f"Make sure '{filename}' is in the correct directory"
                     )
                     all_ok = False
-        
+
         return all_ok
 
     def test_websocket_server(self):
@@ -170,8 +244,9 @@ class ChimeraDiagnostic:
             # Test gamepad creation
             gamepad = Gamepad()
             if gamepad.initialized:
+                # __init__ already sent the neutral state; a reset here
+                # would only repeat the same driver round-trip
                 logger.info("Gamepad initialization - OK")
-                gamepad.reset()
                 return True
             else:
                 self.log_issue(
@@ -193,32 +268,66 @@ class ChimeraDiagnostic:
             )
             return False
 
-    def check_go_environment(self):
+    async def _run_command(self, args, timeout):
+        """Run a command asynchronously, returning (returncode, stdout, stderr).
+
+        Returns None on timeout so callers can report it distinctly.
+        """
+        import asyncio
+
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            return None
+        return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+    async def check_go_environment(self):
         """Check if Go environment is set up correctly."""
         logger.info("Checking Go environment...")
-        
+
+        fingerprint = self._binary_fingerprint('go')
+        if self._cached_check('go', fingerprint):
+            logger.info("Go environment - OK (cached)")
+            return True
+
         try:
             # Check if Go is installed
-            result = subprocess.run(['go', 'version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10)
-            
-            if result.returncode == 0:
-                logger.info(f"Go version: {result.stdout.strip()} - OK")
-                
+            result = await self._run_command(['go', 'version'], timeout=10)
+
+            if result is None:
+                self.log_issue(
+                    "Go command timeout",
+                    "Check Go installation and network connection"
+                )
+                return False
+
+            returncode, stdout, stderr = result
+            if returncode == 0:
+                logger.info(f"Go version: {stdout.strip()} - OK")
+
                 # Check if required Go modules are available
-                go_mod_check = subprocess.run(['go', 'mod', 'tidy'], 
-                                            capture_output=True, 
-                                            text=True, 
-                                            timeout=30)
-                
-                if go_mod_check.returncode == 0:
+                go_mod_check = await self._run_command(['go', 'mod', 'tidy'], timeout=30)
+
+                if go_mod_check is None:
+                    self.log_issue(
+                        "Go command timeout",
+                        "Check Go installation and network connection"
+                    )
+                    return False
+
+                if go_mod_check[0] == 0:
                     logger.info("Go modules - OK")
+                    self._store_check('go', fingerprint, True)
                     return True
                 else:
                     self.log_issue(
-                        f"Go module issues: {go_mod_check.stderr}",
+                        f"Go module issues: {go_mod_check[2]}",
                         "Run 'go mod tidy' to fix dependencies"
                     )
                     return False
@@ -228,34 +337,39 @@ class ChimeraDiagnostic:
                     "Make sure Go is properly installed and in PATH"
                 )
                 return False
-                
+
         except FileNotFoundError:
             self.log_issue(
                 "Go not found",
                 "Install Go from https://golang.org/dl/"
             )
             return False
-        except subprocess.TimeoutExpired:
-            self.log_issue(
-                "Go command timeout",
-                "Check Go installation and network connection"
-            )
-            return False
 
-    def check_ffmpeg(self):
+    async def check_ffmpeg(self):
         """Check if FFmpeg is available."""
         logger.info("Checking FFmpeg...")
-        
+
+        fingerprint = self._binary_fingerprint('ffmpeg')
+        if self._cached_check('ffmpeg', fingerprint):
+            logger.info("FFmpeg - OK (cached)")
+            return True
+
         try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10)
-            
-            if result.returncode == 0:
+            result = await self._run_command(['ffmpeg', '-version'], timeout=10)
+
+            if result is None:
+                self.log_issue(
+                    "FFmpeg command timeout",
+                    "Check FFmpeg installation"
+                )
+                return False
+
+            returncode, stdout, stderr = result
+            if returncode == 0:
                 # Extract version info
-                version_line = result.stdout.split('\n')[0]
+                version_line = stdout.split('\n')[0]
                 logger.info(f"FFmpeg: {version_line} - OK")
+                self._store_check('ffmpeg', fingerprint, True)
                 return True
             else:
                 self.log_issue(
@@ -263,19 +377,13 @@ class ChimeraDiagnostic:
                     "Reinstall FFmpeg"
                 )
                 return False
-                
+
         except FileNotFoundError:
             self.log_issue(
                 "FFmpeg not found",
                 "Install FFmpeg from https://ffmpeg.org/download.html"
             )
             return False
-        except subprocess.TimeoutExpired:
-            self.log_issue(
-                "FFmpeg command timeout",
-                "Check FFmpeg installation"
-            )
-            return False
 
     def run_full_diagnostic(self):
         """Run complete diagnostic check."""
@@ -283,26 +391,50 @@ class ChimeraDiagnostic:
         logger.info("Starting Chimera Diagnostic Check")
         logger.info("="*50)
         
-        checks = [
+        import asyncio
+
+        sync_checks = [
             ("Python Version", self.check_python_version),
             ("Required Modules", self.check_required_modules),
             ("ViGEm Drivers", self.check_vgamepad_drivers),
             ("Network Ports", self.check_network_ports),
             ("File Structure", self.check_file_structure),
             ("WebSocket Server", self.test_websocket_server),
+        ]
+        # Subprocess-based checks are independent and I/O-bound; they run
+        # concurrently so wall clock pays for the slowest, not the sum
+        async_checks = [
             ("Go Environment", self.check_go_environment),
             ("FFmpeg", self.check_ffmpeg),
         ]
-        
+
         results = {}
-        for check_name, check_func in checks:
+        for check_name, check_func in sync_checks:
             logger.info(f"\n--- {check_name} ---")
             try:
                 results[check_name] = check_func()
             except Exception as e:
+                import traceback
                 logger.error(f"Error during {check_name}: {e}")
                 logger.error(traceback.format_exc())
                 results[check_name] = False
+
+        logger.info(f"\n--- {' / '.join(name for name, _ in async_checks)} ---")
+
+        async def _gather_async_checks():
+            return await asyncio.gather(
+                *(check_func() for _, check_func in async_checks),
+                return_exceptions=True
+            )
+
+        for (check_name, _), outcome in zip(async_checks, asyncio.run(_gather_async_checks())):
+            if isinstance(outcome, BaseException):
+                import traceback
+                logger.error(f"Error during {check_name}: {outcome}")
+                logger.error(''.join(traceback.format_exception(outcome)))
+                results[check_name] = False
+            else:
+                results[check_name] = outcome
         
         # Summary
         logger.info("\n" + "="*50)
@@ -331,8 +463,9 @@ def main():
     """Main diagnostic function."""
     print("Chimera Game Streaming Server - Diagnostic Tool")
     print("=" * 60)
-    
-    diagnostic = ChimeraDiagnostic()
+
+    # --no-cache forces the external-binary checks to re-run
+    diagnostic = ChimeraDiagnostic(use_cache='--no-cache' not in sys.argv)
     success = diagnostic.run_full_diagnostic()
     
     if success:
@@ -350,6 +483,7 @@ if __name__ == "__main__":
         print("\nDiagnostic interrupted by user.")
         sys.exit(1)
     except Exception as e:
+        import traceback
         print(f"Diagnostic failed with error: {e}")
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
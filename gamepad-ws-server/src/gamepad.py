@@ -1,19 +1,95 @@
+import asyncio
+import ctypes
 import logging
+import struct
 import time
+from array import array
 from typing import Dict, Optional
 import sys
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
-try:
-    import vgamepad as vg
-    VGAMEPAD_AVAILABLE = True
-    logger.info("vgamepad imported successfully")
-except ImportError as e:
-    VGAMEPAD_AVAILABLE = False
-    logger.error(f"vgamepad not available: {e}")
-    logger.error("Install with: pip install vgamepad")
+# vgamepad is imported lazily in Gamepad.__init__: it probes the ViGEm
+# driver through ctypes at import time, which is wasted work for callers
+# that only need type hints, mocks, or availability checks.
+
+def _noop(*args, **kwargs):
+    """Stand-in for logger.debug when DEBUG logging is disabled."""
+
+def vgamepad_available() -> bool:
+    """Check whether the vgamepad package is installed without importing it."""
+    import importlib.util
+    return importlib.util.find_spec('vgamepad') is not None
+
+# Wire format of one input event: input type, index, int16 value
+_EVENT = struct.Struct('<BBh')
+
+# Internal axis names indexed by wire axis id
+_AXIS_NAMES = ('lx', 'ly', 'rx', 'ry', 'lt', 'rt')
+
+# Stick deadzone; values inside it collapse to neutral, values outside
+# are rescaled so the usable range still spans the full -1.0..1.0
+_STICK_DEADZONE = 0.08
+
+def _normalize_stick(value: int) -> float:
+    """Normalize an int16 stick value to -1.0..1.0 with deadzone applied."""
+    normalized = max(-1.0, min(1.0, value / 32767.0))
+    if abs(normalized) < _STICK_DEADZONE:
+        return 0.0
+    sign = 1 if normalized > 0 else -1
+    return sign * (abs(normalized) - _STICK_DEADZONE) / (1.0 - _STICK_DEADZONE)
+
+def _normalize_trigger(value: int) -> float:
+    """Normalize an int16 trigger value to 0.0..1.0."""
+    return max(0.0, min(1.0, value / 32767.0))
+
+# Normalized float per possible int16 input, indexed by value + 32768.
+# One array load per event instead of divide + clamp + deadzone math.
+_STICK_LUT = array('d', [_normalize_stick(v - 32768) for v in range(65536)])
+_TRIGGER_LUT = array('d', [_normalize_trigger(v - 32768) for v in range(65536)])
+
+# Normalization table per wire axis id (sticks share one, triggers the other)
+_AXIS_LUTS = (_STICK_LUT, _STICK_LUT, _STICK_LUT, _STICK_LUT,
+              _TRIGGER_LUT, _TRIGGER_LUT)
+
+# Quantized report values per possible int16 input: the exact int16 (sticks)
+# or uint8 (triggers) written into the XUSB report, so the per-event write
+# is a table load instead of a float multiply + int conversion
+_STICK_OUT = array('h', [int(_normalize_stick(v - 32768) * 32767)
+                         for v in range(65536)])
+_TRIGGER_OUT = array('B', [int(_normalize_trigger(v - 32768) * 255)
+                           for v in range(65536)])
+
+# XUSB buttons indexed by wire button id; populated by _build_button_table
+# on first Gamepad construction, once vgamepad has been imported.
+# _XUSB_BITS holds the same entries as raw ints: the XUSB_BUTTON enum
+# values are exactly the XINPUT bit flags used in XUSB_REPORT.wButtons.
+_BUTTON_IDS = ()
+_XUSB_BITS = ()
+
+def _build_button_table(vg):
+    """Populate _BUTTON_IDS/_XUSB_BITS from the imported vgamepad module."""
+    global _BUTTON_IDS, _XUSB_BITS
+    if _BUTTON_IDS:
+        return
+    _BUTTON_IDS = (
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,    # L1
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,   # R1
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,             # Select/Share
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_START,            # Start/Options
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,       # L3
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,      # R3
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
+        vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
+    )
+    _XUSB_BITS = tuple(int(button) for button in _BUTTON_IDS)
 
 class Gamepad:
     def __init__(self):
@@ -24,18 +100,39 @@ class Gamepad:
             'rx': 0.0, 'ry': 0.0,  # Right Stick
             'lt': 0.0, 'rt': 0.0   # Left/Right Trigger
         }
-        self.buttons_state = {}  # Track button states
+        self._btn_mask = 0  # Pressed buttons as a bitmask by wire button id
         self.last_update = 0
         self.update_threshold = 1.0 / 120.0  # 120 Hz max update rate
+        self._dirty = False  # Report changed since last flush
         self.initialized = False
-        
-        if not VGAMEPAD_AVAILABLE:
-            logger.error("[Gamepad] Cannot initialize: vgamepad not available")
+        # Resolved once at construction: a no-op stub when DEBUG is filtered
+        # keeps even the logging-call overhead out of the hot handlers
+        self._dbg = logger.debug if logger.isEnabledFor(logging.DEBUG) else _noop
+
+        try:
+            import vgamepad as vg
+        except ImportError as e:
+            logger.error(f"[Gamepad] Cannot initialize: vgamepad not available: {e}")
             raise ImportError("vgamepad library not available. Install with: pip install vgamepad")
-        
+
+        self._vg = vg
+        _build_button_table(vg)
+
         try:
             logger.info("[Gamepad] Attempting to create Xbox 360 virtual controller...")
             self.vgpad = vg.VX360Gamepad()
+            # Cache the raw XUSB report so the hot path can write its fields
+            # directly instead of going through the float wrapper methods
+            self._report = self.vgpad.report
+            # Snapshot of the pristine (neutral) report; reset() copies it
+            # back over the live report in a single memmove
+            self._neutral_report = bytes(self._report)
+            # Dispatch tables indexed by input type / wire axis id; replaces
+            # the if/elif chains on the hot path
+            self._input_dispatch = (self._handle_axis_input, self._handle_button_input)
+            self._axis_dispatch = (self._set_lx, self._set_ly,
+                                   self._set_rx, self._set_ry,
+                                   self._set_lt, self._set_rt)
             self.initialized = True
             logger.info("[Gamepad] Xbox 360 virtual controller initialized successfully")
             
@@ -51,10 +148,7 @@ class Gamepad:
     def _send_neutral_state(self):
         """Send neutral state to ensure controller is working."""
         try:
-            self.vgpad.left_joystick_float(x_value_float=0.0, y_value_float=0.0)
-            self.vgpad.right_joystick_float(x_value_float=0.0, y_value_float=0.0)
-            self.vgpad.left_trigger_float(value_float=0.0)
-            self.vgpad.right_trigger_float(value_float=0.0)
+            # A freshly created report is already neutral; just push it
             self.vgpad.update()
             logger.debug("[Gamepad] Neutral state sent successfully")
         except Exception as e:
@@ -71,26 +165,16 @@ class Gamepad:
             return False
         
         try:
-            current_time = time.time()
-            
-            # Rate limiting to prevent excessive updates
-            if current_time - self.last_update < self.update_threshold:
-                return True
-                
             # Validate input parameters
             if not self._validate_input(input_type, idx, value):
                 return False
                 
-            success = False
-            if input_type == 0:  # Handle Axes
-                success = self._handle_axis_input(idx, value)
-            elif input_type == 1:  # Handle Buttons
-                success = self._handle_button_input(idx, value)
-            
+            # input_type 0 = axes, 1 = buttons; validated above
+            success = self._input_dispatch[input_type](idx, value)
+
             if success:
-                # Update the virtual gamepad
-                self.vgpad.update()
-                self.last_update = current_time
+                # Mark the report dirty; the flush loop sends it to the driver
+                self._dirty = True
                 return True
             else:
                 return False
@@ -99,22 +183,70 @@ class Gamepad:
             logger.error(f"[Gamepad] Error handling input: {e}")
             return False
 
+    def handle_inputs_batch(self, buf: bytes) -> bool:
+        """
+        Process a buffer of concatenated 4-byte input events in one call.
+        Invalid events are logged and skipped; returns True when every
+        event in the batch was applied successfully.
+        """
+        if not self.initialized or not self.vgpad:
+            logger.error("[Gamepad] Controller not initialized, cannot process input")
+            return False
+
+        if len(buf) % _EVENT.size:
+            logger.warning("[Gamepad] Batch length %d is not a multiple of %d",
+                           len(buf), _EVENT.size)
+            return False
+
+        all_ok = True
+        applied = False
+        # iter_unpack walks the whole buffer in C; one Python frame per
+        # batch instead of one handle_input call per event
+        for input_type, idx, value in _EVENT.iter_unpack(buf):
+            if self._validate_input(input_type, idx, value) and \
+                    self._input_dispatch[input_type](idx, value):
+                applied = True
+            else:
+                all_ok = False
+
+        if applied:
+            # Mark the report dirty; the flush loop sends it to the driver
+            self._dirty = True
+
+        return all_ok
+
+    async def _flush_loop(self):
+        """
+        Flush pending report changes to the driver at a fixed tick rate.
+        Coalesces bursts of input events into a single update() call, so the
+        driver sees at most one IOCTL per tick instead of one per event.
+        """
+        while True:
+            await asyncio.sleep(self.update_threshold)
+            if self._dirty:
+                try:
+                    self.vgpad.update()
+                    self._dirty = False
+                    self.last_update = time.time()
+                except Exception as e:
+                    logger.error(f"[Gamepad] Error flushing update: {e}")
+
     def _validate_input(self, input_type: int, idx: int, value: int) -> bool:
         """Validate input parameters."""
         if input_type not in [0, 1]:
-            logger.warning(f"[Gamepad] Invalid input type: {input_type}")
+            logger.warning("[Gamepad] Invalid input type: %d", input_type)
             return False
         
         if input_type == 0 and (idx < 0 or idx > 5):  # Axis validation
-            logger.warning(f"[Gamepad] Invalid axis index: {idx}")
+            logger.warning("[Gamepad] Invalid axis index: %d", idx)
             return False
         
         if input_type == 1 and (idx < 0 or idx > 13):  # Button validation
-            logger.warning(f"[Gamepad] Invalid button index: {idx}")
+            logger.warning("[Gamepad] Invalid button index: %d", idx)
             return False
         
         if not (-32768 <= value <= 32767):  # Value range validation
-            logger.warning(f"[Gamepad] Invalid value: {value}")
+            logger.warning("[Gamepad] Invalid value: %d", value)
             return False
         
         return True
@@ -122,105 +254,67 @@ class Gamepad:
     def _handle_axis_input(self, idx: int, value: int) -> bool:
         """Handle axis input (analog sticks and triggers)."""
         try:
-            # Mapping of received axis IDs to internal names
-            axis_map = {
-                0: 'lx', 1: 'ly',  # Left Stick
-                2: 'rx', 3: 'ry',  # Right Stick
-                4: 'lt',           # Left Trigger (L2)
-                5: 'rt'            # Right Trigger (R2)
-            }
-            
-            if idx not in axis_map:
-                logger.warning(f"[Gamepad] Unknown axis index: {idx}")
-                return False
-                
-            axis_name = axis_map[idx]
-            
-            # Convert int16 to float (-1.0 to 1.0 for sticks, 0.0 to 1.0 for triggers)
-            if axis_name in ['lt', 'rt']:  # Triggers are 0.0 to 1.0
-                normalized_value = max(0.0, min(1.0, value / 32767.0))
-            else:  # Analog sticks are -1.0 to 1.0
-                normalized_value = max(-1.0, min(1.0, value / 32767.0))
-            
-            # Apply deadzone for analog sticks
-            if axis_name in ['lx', 'ly', 'rx', 'ry']:
-                deadzone = 0.08
-                if abs(normalized_value) < deadzone:
-                    normalized_value = 0.0
-                else:
-                    # Scale to account for deadzone
-                    sign = 1 if normalized_value > 0 else -1
-                    normalized_value = sign * (abs(normalized_value) - deadzone) / (1.0 - deadzone)
-            
+            # idx is already bounds-checked by _validate_input
+            axis_name = _AXIS_NAMES[idx]
+
+            # Clamp + deadzone are precomputed per int16 value in the LUTs
+            normalized_value = _AXIS_LUTS[idx][value + 32768]
+
             # Only update if value changed significantly
             if abs(self.axes[axis_name] - normalized_value) < 0.001:
                 return True  # Not an error, just no change needed
-                
+
             self.axes[axis_name] = normalized_value
+            self._axis_dispatch[idx](value)
 
-            # Update specific components of the virtual controller
-            if axis_name in ['lx', 'ly']:  # Left stick
-                self.vgpad.left_joystick_float(
-                    x_value_float=self.axes['lx'], 
-                    y_value_float=self.axes['ly']
-                )
-            elif axis_name in ['rx', 'ry']:  # Right stick
-                self.vgpad.right_joystick_float(
-                    x_value_float=self.axes['rx'], 
-                    y_value_float=self.axes['ry']
-                )
-            elif axis_name == 'lt':  # Left trigger
-                self.vgpad.left_trigger_float(value_float=normalized_value)
-            elif axis_name == 'rt':  # Right trigger
-                self.vgpad.right_trigger_float(value_float=normalized_value)
-            
             return True
-            
+
         except Exception as e:
             logger.error(f"[Gamepad] Error handling axis input: {e}")
             return False
 
+    # Per-axis report writers; each takes the raw int16 wire value and
+    # stores the precomputed quantized result straight into the XUSB report
+    def _set_lx(self, value: int):
+        self._report.sThumbLX = _STICK_OUT[value + 32768]
+
+    def _set_ly(self, value: int):
+        self._report.sThumbLY = _STICK_OUT[value + 32768]
+
+    def _set_rx(self, value: int):
+        self._report.sThumbRX = _STICK_OUT[value + 32768]
+
+    def _set_ry(self, value: int):
+        self._report.sThumbRY = _STICK_OUT[value + 32768]
+
+    def _set_lt(self, value: int):
+        self._report.bLeftTrigger = _TRIGGER_OUT[value + 32768]
+
+    def _set_rt(self, value: int):
+        self._report.bRightTrigger = _TRIGGER_OUT[value + 32768]
+
     def _handle_button_input(self, idx: int, value: int) -> bool:
         """Handle button input."""
         try:
-            # Mapping of received button IDs to vgamepad buttons
-            button_mapping = {
-                0: vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-                1: vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-                2: vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-                3: vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-                4: vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,    # L1
-                5: vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,   # R1
-                6: vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,             # Select/Share
-                7: vg.XUSB_BUTTON.XUSB_GAMEPAD_START,            # Start/Options
-                8: vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,       # L3
-                9: vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,      # R3
-                10: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
-                11: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
-                12: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
-                13: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
-            }
-            
-            if idx not in button_mapping:
-                logger.warning(f"[Gamepad] Unknown button index: {idx}")
-                return False
-                
-            button = button_mapping[idx]
+            # idx is already bounds-checked by _validate_input
+            bit = 1 << idx
             is_pressed = value == 1
-            
+
             # Only update if button state changed
-            if self.buttons_state.get(idx, False) == is_pressed:
+            if bool(self._btn_mask & bit) == is_pressed:
                 return True  # Not an error, just no change needed
-                
-            self.buttons_state[idx] = is_pressed
-            
+
+            # Set the XINPUT flag straight in the report; the press_button/
+            # release_button wrappers would do the same bit twiddling
             if is_pressed:
-                self.vgpad.press_button(button=button)
-                logger.debug(f"[Gamepad] Button {idx} pressed")
+                self._btn_mask |= bit
+                self._report.wButtons |= _XUSB_BITS[idx]
+                self._dbg("[Gamepad] Button %d pressed", idx)
             else:
-                self.vgpad.release_button(button=button)
-                logger.debug(f"[Gamepad] Button {idx} released")
-            
+                self._btn_mask &= ~bit
+                self._report.wButtons &= ~_XUSB_BITS[idx]
+                self._dbg("[Gamepad] Button %d released", idx)
+
             return True
             
         except Exception as e:
@@ -235,37 +329,14 @@ class Gamepad:
         
         try:
             logger.info("[Gamepad] Resetting controller to neutral state...")
-            
-            # Reset all axes
+
+            # Copy the pre-baked neutral report over the live one: a single
+            # memmove covers every axis, trigger and button field at once
+            ctypes.memmove(ctypes.addressof(self._report),
+                           self._neutral_report,
+                           ctypes.sizeof(self._report))
             self.axes = {k: 0.0 for k in self.axes.keys()}
-            self.vgpad.left_joystick_float(x_value_float=0.0, y_value_float=0.0)
-            self.vgpad.right_joystick_float(x_value_float=0.0, y_value_float=0.0)
-            self.vgpad.left_trigger_float(value_float=0.0)
-            self.vgpad.right_trigger_float(value_float=0.0)
-            
-            # Reset all buttons
-            button_mapping = {
-                0: vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-                1: vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-                2: vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-                3: vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-                4: vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-                5: vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-                6: vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
-                7: vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
-                8: vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,
-                9: vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_THUMB,
-                10: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP,
-                11: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN,
-                12: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT,
-                13: vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
-            }
-            
-            for button_id, is_pressed in self.buttons_state.items():
-                if is_pressed and button_id in button_mapping:
-                    self.vgpad.release_button(button=button_mapping[button_id])
-            
-            self.buttons_state = {}
+            self._btn_mask = 0
             self.vgpad.update()
             logger.info("[Gamepad] Controller reset to neutral state successfully")
             return True
@@ -276,23 +347,43 @@ class Gamepad:
 
     def get_status(self) -> Dict:
         """Get current controller status."""
+        mask = self._btn_mask
         return {
             "initialized": self.initialized,
             "axes": self.axes.copy(),
-            "buttons_pressed": [k for k, v in self.buttons_state.items() if v],
+            "buttons_pressed": [i for i in range(14) if mask >> i & 1],
             "last_update": self.last_update,
-            "total_buttons": len(self.buttons_state),
-            "vgamepad_available": VGAMEPAD_AVAILABLE
+            "total_buttons": mask.bit_count(),
+            "vgamepad_available": vgamepad_available()
         }
 
-    def __del__(self):
-        """Cleanup when object is destroyed."""
+    def close(self):
+        """Reset the controller and release it. Safe to call more than once.
+
+        Explicit cleanup instead of __del__: running driver IOCTLs during
+        interpreter shutdown, when module globals may already be torn down,
+        is both slow and error-prone.
+        """
         if self.initialized and self.vgpad:
             try:
                 self.reset()
                 logger.info("[Gamepad] Controller cleaned up successfully")
             except Exception as e:
                 logger.error(f"[Gamepad] Error during cleanup: {e}")
+            finally:
+                self.initialized = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 # Test function for standalone testing
 def test_gamepad():
@@ -315,6 +406,9 @@ def test_gamepad():
         gamepad.handle_input(1, 0, 1)  # Press A
         time.sleep(0.1)
         gamepad.handle_input(1, 0, 0)  # Release A
+
+        # No flush loop runs in the standalone test; push the report manually
+        gamepad.vgpad.update()
         
         logger.info("Testing reset...")
         gamepad.reset()
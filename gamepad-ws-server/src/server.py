@@ -1,14 +1,26 @@
 import asyncio
+import json
 import websockets
 import logging
 import signal
 import sys
 import time
 import struct
-from typing import Set, Dict, Any, Optional
+from typing import Dict, Any, Optional
+from weakref import WeakSet
 from websockets.server import WebSocketServerProtocol
 from gamepad import Gamepad
 
+# uvloop swaps the pure-Python selector event loop for libuv, cutting
+# per-message loop overhead. It is POSIX-only; on Windows (the usual
+# vgamepad/ViGEm deployment target) stock asyncio is used as-is.
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 # Configure logging with more detail
 logging.basicConfig(
     level=logging.DEBUG,
@@ -20,21 +32,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled wire format of one input event: input type, index, int16 value.
+# Struct.unpack runs entirely in C, skipping the per-call format-string parse.
+_PKT = struct.Struct('<BBh')
+
+# Valid idx values per input type, indexed by the raw uint8 idx byte:
+# axes are 0-5, buttons 0-13. One C-level load replaces chained compares.
+_IDX_VALID = (
+    bytes([1] * 6 + [0] * 250),   # input_type 0: axes
+    bytes([1] * 14 + [0] * 242),  # input_type 1: buttons
+)
+
 class GamepadServer:
     def __init__(self, listen_ip: str = "0.0.0.0", listen_port: int = 9000):
         self.listen_ip = listen_ip
         self.listen_port = listen_port
         self.gamepad: Optional[Gamepad] = None
-        self.clients: Set[WebSocketServerProtocol] = set()
+        # WeakSet: closed connections drop out on their own, so the cleanup
+        # path never has to test-and-remove explicitly
+        self.clients: WeakSet = WeakSet()
         self.running = False
         self.server = None
-        self.stats = {
-            'total_connections': 0,
-            'active_connections': 0,
-            'messages_received': 0,
-            'messages_processed': 0,
-            'errors': 0,
-            'start_time': time.time()
+        self._flush_task = None
+        self._consumer_task = None
+        # Validated input events waiting to be applied to the gamepad;
+        # bounded so a stalled driver sheds load instead of buffering forever
+        self._input_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        # Hot-path counters as plain attributes: incrementing an int slot
+        # is cheaper than hashed dict updates on every message
+        self._total_connections = 0
+        self._active_connections = 0
+        self._messages_received = 0
+        self._messages_processed = 0
+        self._errors = 0
+        self._start_time = time.time()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the server counters, assembled only on request."""
+        return {
+            'total_connections': self._total_connections,
+            'active_connections': self._active_connections,
+            'messages_received': self._messages_received,
+            'messages_processed': self._messages_processed,
+            'errors': self._errors,
+            'start_time': self._start_time,
         }
 
     async def initialize_gamepad(self) -> bool:
@@ -42,6 +84,9 @@ class GamepadServer:
         try:
             logger.info("Initializing gamepad controller...")
             self.gamepad = Gamepad()
+            # Flush coalesced report updates to the driver at a fixed tick.
+            # Keep a reference so the task is not garbage-collected.
+            self._flush_task = asyncio.create_task(self.gamepad._flush_loop())
             logger.info("Gamepad controller initialized successfully.")
             return True
         except ImportError as e:
@@ -66,10 +111,10 @@ class GamepadServer:
             
             # Add client to active connections
             self.clients.add(websocket)
-            self.stats['total_connections'] += 1
-            self.stats['active_connections'] += 1
+            self._total_connections += 1
+            self._active_connections += 1
             
-            logger.info(f"Client {client_address} connected successfully. Active connections: {self.stats['active_connections']}")
+            logger.info(f"Client {client_address} connected successfully. Active connections: {self._active_connections}")
             
             # Send welcome message
             try:
@@ -83,7 +128,7 @@ class GamepadServer:
                     await self.process_message(websocket, message, client_address)
                 except Exception as e:
                     logger.error(f"Error processing message from {client_address}: {e}")
-                    self.stats['errors'] += 1
+                    self._errors += 1
                     # Continue processing other messages instead of breaking
                     
         except websockets.exceptions.ConnectionClosed as e:
@@ -99,20 +144,19 @@ class GamepadServer:
         except Exception as e:
             logger.error(f"Unexpected error handling client {client_address}: {e}")
             logger.exception("Full traceback:")
-            self.stats['errors'] += 1
+            self._errors += 1
         finally:
             # Cleanup client connection
             try:
-                if websocket in self.clients:
-                    self.clients.remove(websocket)
-                self.stats['active_connections'] -= 1
-                logger.info(f"Client {client_address} cleanup completed. Active: {self.stats['active_connections']}")
+                self.clients.discard(websocket)
+                self._active_connections -= 1
+                logger.info(f"Client {client_address} cleanup completed. Active: {self._active_connections}")
             except Exception as e:
                 logger.error(f"Error during client cleanup for {client_address}: {e}")
 
     async def process_message(self, websocket: WebSocketServerProtocol, message: Any, client_address: str):
         """Process incoming WebSocket message with detailed error handling."""
-        self.stats['messages_received'] += 1
+        self._messages_received += 1
         
         try:
             if isinstance(message, bytes):
@@ -125,7 +169,7 @@ class GamepadServer:
         except Exception as e:
             logger.error(f"Error processing message from {client_address}: {e}")
             logger.exception("Full traceback:")
-            self.stats['errors'] += 1
+            self._errors += 1
             raise  # Re-raise to be handled by caller
 
     async def handle_binary_message(self, message: bytes, client_address: str):
@@ -141,44 +185,57 @@ class GamepadServer:
             return
 
         try:
-            # Unpack the binary message safely
+            # Unpack the binary message safely; unpack_from skips the
+            # exact-length recheck the guard above already performed
             try:
-                input_type, idx, value = struct.unpack('<BBh', message)
+                input_type, idx, value = _PKT.unpack_from(message)
             except struct.error as e:
                 logger.error(f"Error unpacking binary message from {client_address}: {e}")
                 return
             
-            # Validate input parameters
-            if input_type not in [0, 1]:
-                logger.warning(f"Invalid input type from {client_address}: {input_type}")
-                return
-            
-            if input_type == 0 and (idx < 0 or idx > 5):  # Axis validation
-                logger.warning(f"Invalid axis index from {client_address}: {idx}")
-                return
-                
-            if input_type == 1 and (idx < 0 or idx > 13):  # Button validation
-                logger.warning(f"Invalid button index from {client_address}: {idx}")
-                return
-            
-            if not (-32768 <= value <= 32767):  # Value range validation
-                logger.warning(f"Invalid value from {client_address}: {value}")
+            # Validate input parameters. input_type/idx come from uint8
+            # fields (never negative) and '<h' already bounds value to
+            # int16, so one table load covers the index check.
+            if input_type > 1 or not _IDX_VALID[input_type][idx]:
+                logger.warning("Invalid packet from %s: type=%d, idx=%d",
+                               client_address, input_type, idx)
                 return
 
-            # Process the input
-            self.gamepad.handle_input(input_type, idx, value)
-            self.stats['messages_processed'] += 1
-            
-            # Debug logging for first few messages
-            if self.stats['messages_processed'] <= 10:
-                logger.debug(f"Processed input from {client_address}: type={input_type}, idx={idx}, value={value}")
-            
+            # Hand the event to the consumer task; the receive coroutine
+            # goes straight back to reading the socket
+            try:
+                self._input_queue.put_nowait((input_type, idx, value))
+            except asyncio.QueueFull:
+                logger.warning(f"Input queue full, dropping event from {client_address}")
+                self._errors += 1
+
         except Exception as e:
             logger.error(f"Error processing binary message from {client_address}: {e}")
             logger.exception("Full traceback:")
-            self.stats['errors'] += 1
+            self._errors += 1
             raise
 
+    async def _consume_inputs(self):
+        """Apply queued input events to the gamepad off the receive path.
+
+        Drains everything immediately available per wakeup, so a burst of
+        events is applied in one batch and coalesced into a single driver
+        update by the gamepad's flush loop.
+        """
+        while True:
+            event = await self._input_queue.get()
+            while True:
+                try:
+                    self.gamepad.handle_input(*event)
+                    self._messages_processed += 1
+                except Exception as e:
+                    logger.error(f"Error applying input event: {e}")
+                    self._errors += 1
+                try:
+                    event = self._input_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
     async def handle_text_message(self, message: str, client_address: str, websocket: WebSocketServerProtocol):
         """Handle text messages with proper response handling."""
         try:
@@ -216,16 +273,18 @@ class GamepadServer:
     async def send_status_to_client(self, websocket: WebSocketServerProtocol, client_address: str):
         """Send status information back to client."""
         try:
-            uptime = time.time() - self.stats['start_time']
+            uptime = time.time() - self._start_time
             
             status = {
-                'server_stats': self.stats.copy(),
+                'server_stats': self.stats,
                 'gamepad_status': self.gamepad.get_status() if self.gamepad else None,
                 'uptime_seconds': uptime,
                 'uptime_formatted': f"{uptime:.1f}s"
             }
             
-            status_json = str(status)  # Simple string conversion
+            # Proper JSON; str(dict) produced Python repr that no client
+            # could parse, via a slow recursive PyObject_Str walk
+            status_json = json.dumps(status)
             await websocket.send(status_json)
             logger.debug(f"Status sent to {client_address}")
                     
@@ -252,15 +311,16 @@ class GamepadServer:
                 ping_interval=30,    # Send ping every 30 seconds
                 ping_timeout=10,     # Wait 10 seconds for pong
                 close_timeout=10,    # Wait 10 seconds for close
-                max_size=1024,       # 1KB max message size (plenty for gamepad data)
+                max_size=16,         # 4-byte input packets + short text commands
                 max_queue=32,        # Max 32 messages in queue
                 compression=None,    # Disable compression for lower latency
             )
             
             self.running = True
             logger.info(f"WebSocket server started successfully on ws://{self.listen_ip}:{self.listen_port}")
-            
-            # Start periodic status logging
+
+            # Start the input consumer and periodic status logging
+            self._consumer_task = asyncio.create_task(self._consume_inputs())
             asyncio.create_task(self.log_status_periodically())
             
             return True
@@ -280,18 +340,18 @@ class GamepadServer:
         while self.running:
             try:
                 await asyncio.sleep(60)  # Log every minute
-                uptime = time.time() - self.stats['start_time']
+                uptime = time.time() - self._start_time
                 
                 # Calculate rates
-                message_rate = self.stats['messages_processed'] / max(uptime, 1)
-                error_rate = self.stats['errors'] / max(uptime, 1)
+                message_rate = self._messages_processed / max(uptime, 1)
+                error_rate = self._errors / max(uptime, 1)
                 
                 logger.info(
                     f"Server Status - Uptime: {uptime:.1f}s, "
-                    f"Active: {self.stats['active_connections']}, "
-                    f"Total: {self.stats['total_connections']}, "
-                    f"Messages: {self.stats['messages_processed']}/{self.stats['messages_received']}, "
-                    f"Errors: {self.stats['errors']}, "
+                    f"Active: {self._active_connections}, "
+                    f"Total: {self._total_connections}, "
+                    f"Messages: {self._messages_processed}/{self._messages_received}, "
+                    f"Errors: {self._errors}, "
                     f"Msg Rate: {message_rate:.2f}/s, "
                     f"Error Rate: {error_rate:.4f}/s"
                 )
@@ -302,14 +362,20 @@ class GamepadServer:
         """Shutdown the server gracefully."""
         logger.info("Starting server shutdown...")
         self.running = False
-        
-        # Reset gamepad to default state
+
+        # Stop consuming and flushing before releasing the controller
+        if self._consumer_task:
+            self._consumer_task.cancel()
+        if self._flush_task:
+            self._flush_task.cancel()
+
+        # Reset the gamepad and release it
         if self.gamepad:
             try:
-                self.gamepad.reset()
-                logger.info("Gamepad reset to default state")
+                self.gamepad.close()
+                logger.info("Gamepad reset and released")
             except Exception as e:
-                logger.error(f"Error resetting gamepad during shutdown: {e}")
+                logger.error(f"Error closing gamepad during shutdown: {e}")
         
         # Close all client connections
         if self.clients:
@@ -334,12 +400,12 @@ class GamepadServer:
                 logger.error(f"Error closing server: {e}")
         
         # Log final statistics
-        uptime = time.time() - self.stats['start_time']
+        uptime = time.time() - self._start_time
         logger.info(
             f"Final Stats - Uptime: {uptime:.1f}s, "
-            f"Total Connections: {self.stats['total_connections']}, "
-            f"Messages Processed: {self.stats['messages_processed']}, "
-            f"Errors: {self.stats['errors']}"
+            f"Total Connections: {self._total_connections}, "
+            f"Messages Processed: {self._messages_processed}, "
+            f"Errors: {self._errors}"
         )
 
 async def main():
@@ -1,84 +1,252 @@
+import atexit
 import logging
+import operator
+import re
+import threading
 import time
 import json
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Any, Dict, Optional, Union
-from datetime import datetime
-import traceback
+
+# Characters unsafe in filenames: reserved punctuation plus control chars,
+# folded into one compiled pattern so sanitizing is a single pass
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Highest valid gamepad index per input type (0 = axis, 1 = button)
+_IDX_LIMIT = (5, 13)
+
+# Quality multipliers for calculate_bitrate, in thousandths (fixed point)
+_QUALITY_MUL_FX = {"low": 100, "medium": 200, "high": 300, "ultra": 500}
+
+# Units for format_bytes, one per 10 bits of magnitude
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Codecs validate_stream_config accepts
+_SUPPORTED_CODECS = frozenset({"h264", "h265", "vp8", "vp9"})
+
+# Stream-config fields, as both the required-field list and a C-level
+# extractor that pulls all four values in one call
+_STREAM_REQUIRED = ["width", "height", "fps", "codec"]
+_STREAM_FIELDS = operator.itemgetter(*_STREAM_REQUIRED)
+
+# Frozenset form of required-field lists, keyed by tuple, so repeated
+# schemas (e.g. the stream config) reuse one set across validations
+_REQ_CACHE: Dict[tuple, frozenset] = {}
+
+# psutil is only needed for get_system_info; keep the rest of the module
+# importable without it
+try:
+    import platform
+    import psutil
+
+    # These fields never change for the lifetime of the process
+    _PLATFORM_INFO = {
+        "platform": platform.system(),
+        "platform_version": platform.version(),
+        "python_version": platform.python_version(),
+        "cpu_count": psutil.cpu_count(),
+    }
+except ImportError:
+    psutil = None
+    _PLATFORM_INFO = None
+
+# Recent get_system_info result; refreshed when older than the TTL so a
+# polling dashboard does not re-run the psutil syscalls on every request
+_SYSINFO_TTL = 1.0
+_sysinfo_cache = {"t": 0.0, "v": None}
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Logger methods keyed by level name; one dict probe replaces the
+# if/elif chain and repeated str.upper() calls in log_message
+_LEVEL_METHODS = {
+    "DEBUG": logger.debug,
+    "INFO": logger.info,
+    "WARNING": logger.warning,
+    "ERROR": logger.error,
+    "CRITICAL": logger.critical,
+}
+
+# Matching numeric levels, for the isEnabledFor short-circuit
+_LEVEL_INT = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Bound once so the hot timestamp paths skip the module attribute lookups
+_time = time.time
+_monotonic = time.monotonic
+_perf_ns = time.perf_counter_ns
+
+# Cached ISO-timestamp prefix for the current second; only the
+# microsecond suffix changes between most consecutive calls
+_ts_cache = [0, '']
+
+def _fast_iso_now() -> str:
+    """datetime.now().isoformat() equivalent with a per-second strftime cache."""
+    t = _time()
+    sec = int(t)
+    if sec != _ts_cache[0]:
+        _ts_cache[1] = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _ts_cache[0] = sec
+    return f"{_ts_cache[1]}.{int((t - sec) * 1_000_000):06d}"
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that caches the strftime result for the current second.
+
+    %(asctime)s re-runs strftime for every record, which is measurably
+    expensive at high log rates. Most consecutive records share the same
+    timestamp second, so cache the formatted prefix and only stitch the
+    millisecond part on per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = -1
+        self._last_str = ''
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            # Custom date formats take the stock (uncached) path
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(self.default_time_format,
+                                           time.localtime(sec))
+            self._last_sec = sec
+        return self.default_msec_format % (self._last_str, record.msecs)
+
+class BufferedFileHandler(logging.Handler):
+    """File handler with a large write buffer and severity/interval flushing.
+
+    The stock FileHandler ends up issuing roughly one write() syscall per
+    record. Routine records instead land in a 64 KiB buffer that is only
+    flushed when a WARNING-or-worse record arrives (so problems hit disk
+    immediately) or when the flush interval elapses.
+    """
+
+    FLUSH_INTERVAL = 30.0  # seconds
+
+    def __init__(self, log_file: str, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.stream = open(log_file, 'a', buffering=65536, encoding='utf-8')
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + "\n")
+            if (record.levelno >= logging.WARNING
+                    or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        try:
+            self.flush()
+            self.stream.close()
+        finally:
+            super().close()
+
+# Active QueueListener installed by setup_logging, stopped at exit (or
+# when setup_logging reconfigures) so queued records are drained
+_queue_listener = None
+
+def _stop_queue_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 class ChimeraUtils:
     """Utility class for Chimera game streaming server."""
     
     @staticmethod
     def setup_logging(log_file: str = "chimera.log", level: int = logging.INFO) -> logging.Logger:
         """Setup comprehensive logging configuration."""
-        
-        # Create formatter
-        formatter = logging.Formatter(
+
+        global _queue_listener
+
+        # Create formatter (asctime cached per second, see CachedTimeFormatter)
+        formatter = CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
         )
-        
-        # Create file handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+
+        # Create file handler (buffered; see BufferedFileHandler)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        
+
         # Create console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        
+
+        # The real handlers run in a QueueListener thread; logging callers
+        # only pay for an enqueue, never for file/console I/O
+        if _queue_listener is not None:
+            _queue_listener.stop()
+        log_queue = SimpleQueue()
+        _queue_listener = QueueListener(log_queue, file_handler, console_handler,
+                                        respect_handler_level=True)
+        _queue_listener.start()
+
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
         root_logger.handlers = []  # Clear existing handlers
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
-        
+        root_logger.addHandler(QueueHandler(log_queue))
+
         return root_logger
 
     @staticmethod
     def log_message(message: str, level: str = "INFO", extra_data: Optional[Dict] = None) -> None:
         """Enhanced logging with structured data."""
         
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "message": message,
-            "level": level.upper()
-        }
-        
+        level = level.upper()
+
+        # Bail out before any allocation when the record would be filtered
+        if not logger.isEnabledFor(_LEVEL_INT.get(level, logging.INFO)):
+            return
+
+        # Log based on level (unknown levels fall back to info)
+        method = _LEVEL_METHODS.get(level, logger.info)
         if extra_data:
-            log_entry.update(extra_data)
-        
-        # Log based on level
-        if level.upper() == "DEBUG":
-            logger.debug(message, extra=extra_data or {})
-        elif level.upper() == "INFO":
-            logger.info(message, extra=extra_data or {})
-        elif level.upper() == "WARNING":
-            logger.warning(message, extra=extra_data or {})
-        elif level.upper() == "ERROR":
-            logger.error(message, extra=extra_data or {})
-        elif level.upper() == "CRITICAL":
-            logger.critical(message, extra=extra_data or {})
+            method(message, extra=extra_data)
+        else:
+            method(message)
 
     @staticmethod
     def handle_error(error: Exception, context: str = "", reraise: bool = False) -> None:
         """Enhanced error handling with context and stack traces."""
         
-        error_info = {
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "context": context,
-            "traceback": traceback.format_exc(),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        logger.error(f"Error in {context}: {error}", extra=error_info)
-        
+        # Traceback formatting dominates the cost here; skip everything when
+        # no handler would emit the record, and pass exc_info so the logging
+        # machinery formats the stack only if a handler actually needs it
+        if logger.isEnabledFor(logging.ERROR):
+            error_info = {
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "context": context,
+                "timestamp": _fast_iso_now()
+            }
+            logger.error(f"Error in {context}: {error}", extra=error_info, exc_info=error)
+
         if reraise:
             raise error
 
@@ -94,14 +262,18 @@ class ChimeraUtils:
             return False
         
         if required_fields and isinstance(data, dict):
-            missing_fields = [field for field in required_fields if field not in data]
-            if missing_fields:
+            required = _REQ_CACHE.setdefault(tuple(required_fields),
+                                             frozenset(required_fields))
+            # Superset test runs in C; the diff list is only built when
+            # something is actually missing
+            if not required.issubset(data.keys()):
+                missing_fields = [field for field in required_fields if field not in data]
                 ChimeraUtils.log_message(
                     f"Missing required fields: {missing_fields}",
                     "ERROR"
                 )
                 return False
-        
+
         return True
 
     @staticmethod
@@ -115,7 +287,7 @@ class ChimeraUtils:
         
         response = {
             "success": success,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _fast_iso_now(),
             "data": data
         }
         
@@ -132,73 +304,63 @@ class ChimeraUtils:
         """Validate gamepad input parameters."""
         
         # Validate input type
-        if input_type not in [0, 1]:
+        if input_type not in (0, 1):
             ChimeraUtils.log_message(
                 f"Invalid input type: {input_type}. Must be 0 (axis) or 1 (button)",
                 "ERROR"
             )
             return False
-        
-        # Validate axis indices
-        if input_type == 0 and (idx < 0 or idx > 5):
-            ChimeraUtils.log_message(
-                f"Invalid axis index: {idx}. Must be between 0-5",
-                "ERROR"
-            )
-            return False
-        
-        # Validate button indices
-        if input_type == 1 and (idx < 0 or idx > 13):
+
+        # Validate the index against the per-type limit (axes 0-5, buttons 0-13)
+        if not 0 <= idx <= _IDX_LIMIT[input_type]:
             ChimeraUtils.log_message(
-                f"Invalid button index: {idx}. Must be between 0-13",
+                f"Invalid index: {idx}. Must be between 0-{_IDX_LIMIT[input_type]}",
                 "ERROR"
             )
             return False
-        
+
         # Validate value range
-        if not (-32768 <= value <= 32767):
+        if not -32768 <= value <= 32767:
             ChimeraUtils.log_message(
                 f"Invalid value: {value}. Must be between -32768 and 32767",
                 "ERROR"
             )
             return False
-        
+
         return True
 
     @staticmethod
     def validate_stream_config(config: Dict[str, Any]) -> bool:
         """Validate streaming configuration parameters."""
         
-        required_fields = ["width", "height", "fps", "codec"]
-        if not ChimeraUtils.validate_input(config, dict, required_fields):
+        if not ChimeraUtils.validate_input(config, dict, _STREAM_REQUIRED):
             return False
-        
+
+        # validate_input guarantees presence, so one itemgetter call pulls
+        # all four fields without per-field dict probes
+        width, height, fps, codec = _STREAM_FIELDS(config)
+
         # Validate resolution
-        width = config.get("width", 0)
-        height = config.get("height", 0)
-        
         if not (320 <= width <= 3840 and 240 <= height <= 2160):
             ChimeraUtils.log_message(
                 f"Invalid resolution: {width}x{height}. Must be between 320x240 and 3840x2160",
                 "ERROR"
             )
             return False
-        
+
         # Validate FPS
-        fps = config.get("fps", 0)
-        if not (1 <= fps <= 144):
+        if not 1 <= fps <= 144:
             ChimeraUtils.log_message(
                 f"Invalid FPS: {fps}. Must be between 1 and 144",
                 "ERROR"
             )
             return False
-        
+
         # Validate codec
-        supported_codecs = ["h264", "h265", "vp8", "vp9"]
-        codec = config.get("codec", "").lower()
-        if codec not in supported_codecs:
+        codec = codec.lower()
+        if codec not in _SUPPORTED_CODECS:
             ChimeraUtils.log_message(
-                f"Unsupported codec: {codec}. Supported: {supported_codecs}",
+                f"Unsupported codec: {codec}. Supported: {sorted(_SUPPORTED_CODECS)}",
                 "ERROR"
             )
             return False
@@ -209,35 +371,27 @@ class ChimeraUtils:
     def calculate_bitrate(width: int, height: int, fps: int, quality: str = "medium") -> int:
         """Calculate appropriate bitrate based on resolution and quality."""
         
-        pixel_count = width * height
-        base_bitrate = pixel_count * fps
-        
-        # Quality multipliers
-        quality_multipliers = {
-            "low": 0.1,
-            "medium": 0.2,
-            "high": 0.3,
-            "ultra": 0.5
-        }
-        
-        multiplier = quality_multipliers.get(quality.lower(), 0.2)
-        calculated_bitrate = int(base_bitrate * multiplier / 1000)  # Convert to Kbps
-        
+        # Fixed-point multiplier (thousandths) keeps the whole computation
+        # in integer arithmetic: the /1000 quality scale and the /1000
+        # bps->Kbps conversion combine into one floor division
+        multiplier = _QUALITY_MUL_FX.get(quality.lower(), 200)
+        calculated_bitrate = width * height * fps * multiplier // 1_000_000
+
         # Clamp to reasonable ranges
         min_bitrate = 500  # 500 Kbps minimum
         max_bitrate = 50000  # 50 Mbps maximum
-        
+
         return max(min_bitrate, min(calculated_bitrate, max_bitrate))
 
     @staticmethod
     def format_bytes(bytes_count: int) -> str:
         """Format byte count in human readable format."""
         
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_count < 1024.0:
-                return f"{bytes_count:.2f} {unit}"
-            bytes_count /= 1024.0
-        return f"{bytes_count:.2f} PB"
+        # The unit index is just the magnitude in 10-bit steps; bit_length
+        # computes it directly instead of dividing through the units
+        n = int(bytes_count)
+        idx = 0 if n < 1024 else min((n.bit_length() - 1) // 10, 5)
+        return f"{bytes_count / (1 << (idx * 10)):.2f} {_BYTE_UNITS[idx]}"
 
     @staticmethod
     def format_duration(seconds: float) -> str:
@@ -245,94 +399,97 @@ class ChimeraUtils:
         
         if seconds < 60:
             return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        # One divmod chain instead of repeated division on the same number
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{minutes}m {secs}s" if hours == 0 else f"{hours}h {minutes}m"
 
     @staticmethod
     def create_performance_report(metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive performance report."""
         
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "summary": {},
-            "metrics": metrics.copy(),
-            "recommendations": []
-        }
-        
+        # Read each interesting metric once up front; the summary is then
+        # built in a single pass without re-probing the dict
+        total_frames = metrics.get("frames_processed")
+        dropped_frames = metrics.get("frames_dropped")
+        memory_usage = metrics.get("memory_usage")
+        active_streams = metrics.get("active_streams")
+
+        summary = {}
+        recommendations = []
+
         # Calculate summary statistics
-        if "frames_processed" in metrics and "frames_dropped" in metrics:
-            total_frames = metrics["frames_processed"]
-            dropped_frames = metrics["frames_dropped"]
-            
-            if total_frames > 0:
-                drop_rate = (dropped_frames / total_frames) * 100
-                report["summary"]["drop_rate_percent"] = round(drop_rate, 2)
-                
-                if drop_rate > 10:
-                    report["recommendations"].append("High frame drop rate detected. Consider reducing quality or resolution.")
-                elif drop_rate > 5:
-                    report["recommendations"].append("Moderate frame drops detected. Monitor system resources.")
-        
+        if total_frames and dropped_frames is not None:
+            drop_rate = (dropped_frames / total_frames) * 100
+            summary["drop_rate_percent"] = round(drop_rate, 2)
+
+            if drop_rate > 10:
+                recommendations.append("High frame drop rate detected. Consider reducing quality or resolution.")
+            elif drop_rate > 5:
+                recommendations.append("Moderate frame drops detected. Monitor system resources.")
+
         # Memory usage analysis
-        if "memory_usage" in metrics:
-            memory_mb = metrics["memory_usage"] / (1024 * 1024)
-            report["summary"]["memory_usage_mb"] = round(memory_mb, 2)
-            
+        if memory_usage is not None:
+            memory_mb = memory_usage / (1024 * 1024)
+            summary["memory_usage_mb"] = round(memory_mb, 2)
+
             if memory_mb > 1000:
-                report["recommendations"].append("High memory usage detected. Consider optimizing buffer sizes.")
-        
+                recommendations.append("High memory usage detected. Consider optimizing buffer sizes.")
+
         # Connection quality analysis
-        if "active_streams" in metrics:
-            active_streams = metrics["active_streams"]
-            report["summary"]["active_streams"] = active_streams
-            
+        if active_streams is not None:
+            summary["active_streams"] = active_streams
+
             if active_streams > 5:
-                report["recommendations"].append("High number of concurrent streams. Monitor server performance.")
-        
-        return report
+                recommendations.append("High number of concurrent streams. Monitor server performance.")
+
+        return {
+            "timestamp": _fast_iso_now(),
+            "summary": summary,
+            "metrics": dict(metrics),
+            "recommendations": recommendations
+        }
 
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename for safe file operations."""
         
-        import re
-        # Remove dangerous characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        # Remove control characters
-        filename = ''.join(char for char in filename if ord(char) >= 32)
+        # Replace dangerous and control characters in one compiled pass
+        filename = _SANITIZE_RE.sub('_', filename)
         # Limit length
         if len(filename) > 255:
-            name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-            filename = name[:250] + ('.' + ext if ext else '')
-        
+            name, sep, ext = filename.rpartition('.')
+            filename = name[:250] + '.' + ext if sep else filename[:250]
+
         return filename
 
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
         """Get basic system information for debugging."""
-        
-        import platform
-        import psutil
-        
+
+        if psutil is None:
+            ChimeraUtils.log_message("psutil not installed; system info unavailable", "ERROR")
+            return {"error": "Unable to retrieve system information"}
+
+        now = _monotonic()
+        if _sysinfo_cache["v"] is not None and now - _sysinfo_cache["t"] < _SYSINFO_TTL:
+            return _sysinfo_cache["v"]
+
         try:
-            info = {
-                "platform": platform.system(),
-                "platform_version": platform.version(),
-                "python_version": platform.python_version(),
-                "cpu_count": psutil.cpu_count(),
-                "memory_total": psutil.virtual_memory().total,
-                "memory_available": psutil.virtual_memory().available,
-                "disk_usage": {
-                    "total": psutil.disk_usage('/').total if platform.system() != 'Windows' else psutil.disk_usage('C:').total,
-                    "free": psutil.disk_usage('/').free if platform.system() != 'Windows' else psutil.disk_usage('C:').free
-                }
+            virtual_memory = psutil.virtual_memory()
+            disk_root = '/' if _PLATFORM_INFO["platform"] != 'Windows' else 'C:'
+            disk = psutil.disk_usage(disk_root)
+
+            info = dict(_PLATFORM_INFO)
+            info["memory_total"] = virtual_memory.total
+            info["memory_available"] = virtual_memory.available
+            info["disk_usage"] = {
+                "total": disk.total,
+                "free": disk.free
             }
+
+            _sysinfo_cache["t"] = now
+            _sysinfo_cache["v"] = info
             return info
         except Exception as e:
             ChimeraUtils.handle_error(e, "get_system_info")
@@ -358,26 +515,78 @@ def format_response(data: Any = None, success: bool = True, message: str = "", e
     """Convenience function for response formatting."""
     return utils.format_response(data, success, message, error_code)
 
+# Specialized fast paths for the two common response shapes; callers that
+# know their shape skip format_response's optional-field branches
+def ok(data: Any = None) -> Dict[str, Any]:
+    """Success response with data only."""
+    return {"success": True, "timestamp": _fast_iso_now(), "data": data}
+
+def err(error_code: str, message: str) -> Dict[str, Any]:
+    """Error response with code and message."""
+    return {
+        "success": False,
+        "timestamp": _fast_iso_now(),
+        "data": None,
+        "message": message,
+        "error_code": error_code
+    }
+
+# Aggregated monitor_performance timings keyed by function name; hot
+# functions emit one summary record per flush window instead of one log
+# record per call
+_PERF_ACC: Dict[str, Dict[str, int]] = {}
+_PERF_LOCK = threading.Lock()
+_PERF_FLUSH_EVERY = 1000  # calls per function between summaries
+
+def _emit_perf_summary(name: str, acc: Dict[str, int]) -> None:
+    calls = acc['n']
+    logger.info("Function %s: %d calls, avg %.3fms, min %.3fms, max %.3fms",
+                name, calls, acc['sum'] / calls / 1e6,
+                acc['min'] / 1e6, acc['max'] / 1e6)
+
+def _record_perf(name: str, elapsed_ns: int) -> None:
+    with _PERF_LOCK:
+        acc = _PERF_ACC.get(name)
+        if acc is None:
+            acc = _PERF_ACC[name] = {'n': 0, 'sum': 0,
+                                     'min': elapsed_ns, 'max': elapsed_ns}
+        acc['n'] += 1
+        acc['sum'] += elapsed_ns
+        if elapsed_ns < acc['min']:
+            acc['min'] = elapsed_ns
+        elif elapsed_ns > acc['max']:
+            acc['max'] = elapsed_ns
+        if acc['n'] >= _PERF_FLUSH_EVERY:
+            _emit_perf_summary(name, acc)
+            del _PERF_ACC[name]
+
+def _flush_perf() -> None:
+    """Emit summaries for whatever is still accumulated (runs at exit)."""
+    with _PERF_LOCK:
+        for name, acc in _PERF_ACC.items():
+            _emit_perf_summary(name, acc)
+        _PERF_ACC.clear()
+
+atexit.register(_flush_perf)
+
 # Performance monitoring decorator
 def monitor_performance(func_name: str = ""):
     """Decorator to monitor function performance."""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # perf_counter_ns is monotonic (immune to NTP jumps) and cheaper
+            # than time.time(); per-call timings are aggregated and logged
+            # as a summary every _PERF_FLUSH_EVERY calls
+            start = _perf_ns()
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                log_message(
-                    f"Function {func_name or func.__name__} executed successfully",
-                    "DEBUG",
-                    {"execution_time": execution_time}
-                )
+                _record_perf(func_name or func.__name__, _perf_ns() - start)
                 return result
             except Exception as e:
-                execution_time = time.time() - start_time
+                elapsed_ns = _perf_ns() - start
                 handle_error(
-                    e, 
-                    f"Function {func_name or func.__name__} (execution_time: {execution_time:.3f}s)"
+                    e,
+                    f"Function {func_name or func.__name__} (execution_time: {elapsed_ns / 1e9:.3f}s)"
                 )
                 raise
         return wrapper